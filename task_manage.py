@@ -1,56 +1,90 @@
 import sqlite3
+import sys
+from itertools import chain
+from typing import Iterable
 from datetime import datetime, timedelta
-from abc import ABC, abstractmethod
 
-# Abstract base class for task views
-class TaskView(ABC):
+# Valid values for task fields and menu input
+_VALID_PRIORITY = frozenset(("high", "medium", "low"))
+_VALID_STATUS = frozenset(("Pending", "Completed"))
+_VALID_STATUS_CHOICE = frozenset(("1", "2"))
+
+# Menu choices mapped to the values stored in the database
+_PRIORITY_MAP = {"1": "high", "2": "low", "3": "medium"}
+_STATUS_MAP = {"1": "Pending", "2": "Completed"}
+
+# SQL statements are kept as constants so sqlite3's per-connection statement cache can reuse them
+SELECT_COLS = "id, description, deadline, status, priority"
+SQL_INSERT = "INSERT INTO tasks (description, deadline, status, priority) VALUES (?, ?, ?, ?)"
+SQL_SELECT_ALL = f"SELECT {SELECT_COLS} FROM tasks"
+SQL_SELECT_BY_DEADLINE = f"SELECT {SELECT_COLS} FROM tasks ORDER BY deadline"
+SQL_SELECT_BY_PRIORITY = f"SELECT {SELECT_COLS} FROM tasks ORDER BY priority_rank"
+SQL_FILTER = f"SELECT {SELECT_COLS} FROM tasks WHERE status = ?"
+SQL_SEARCH = f"SELECT {SELECT_COLS} FROM tasks WHERE id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?) ORDER BY id"
+SQL_SEARCH_INSTR = f"SELECT {SELECT_COLS} FROM tasks WHERE instr(lower(description), lower(?)) > 0"
+# Deadlines are stored as YYYY-MM-DD text, so they compare directly against SQLite's date()
+SQL_DUE_SOON = f"SELECT {SELECT_COLS} FROM tasks WHERE deadline <= date('now', 'localtime', '+1 day') AND status = 'Pending'"
+
+# Format tasks for display, one line per task
+def _format_tasks(tasks: Iterable) -> str:
     """
-    Abstract base class that defines the interface for task views.
-    Subclasses must implement the display method to show tasks in a specific way.
+    Format tasks as one line per task.
+
+    Args:
+        tasks (iterable): Tasks to format, e.g. a list or an open cursor.
+
+    Returns:
+        str: The formatted tasks, separated by newlines.
     """
-    @abstractmethod
-    def display(self, tasks: list) -> None:
-        """
-        Display tasks.
+    return "\n".join(f"ID: {t[0]}, Description: {t[1]}, Deadline: {t[2]}, Status: {t[3]}, Priority: {t[4]}" for t in tasks)
 
-        Args:
-            tasks (list): List of tasks to display.
-        """
-        pass
+# Read a line of user input from stdin
+def _prompt(prompt: str) -> str:
+    """
+    Write a prompt and read one line from stdin, like input() without its per-call overhead.
+
+    Args:
+        prompt (str): Prompt to write before reading.
 
-# View tasks by deadline
-class DeadlineView(TaskView):
+    Returns:
+        str: The line read, without the trailing newline.
+
+    Raises:
+        EOFError: If stdin is exhausted.
     """
-    View for displaying tasks sorted by deadline.
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+# View for displaying a list of tasks under a header
+class TaskView:
     """
-    def display(self, tasks: list) -> None:
+    View for displaying tasks under a header describing how they are sorted.
+    """
+    def __init__(self, header: str) -> None:
         """
-        Display tasks sorted by deadline.
+        Initialize the view with the header printed above the tasks.
 
         Args:
-            tasks (list): List of tasks to display.
+            header (str): Header line, e.g. "Tasks sorted by Deadline:".
         """
-        print("Tasks sorted by Deadline:")
-        for task in tasks:
-            print(f"ID: {task[0]}, Description: {task[1]}, Deadline: {task[2]}, Status: {task[3]}, Priority: {task[4]}")
+        self._header = header
 
-# View tasks by priority
-class PriorityView(TaskView):
-    """
-    View for displaying tasks sorted by priority.
-    """
     def display(self, tasks: list) -> None:
         """
-        Display tasks sorted by priority.
+        Display tasks below the header.
 
         Args:
             tasks (list): List of tasks to display.
         """
-        print("Tasks sorted by Priority:")
-        for task in tasks:
-            print(f"ID: {task[0]}, Description: {task[1]}, Deadline: {task[2]}, Status: {task[3]}, Priority: {task[4]}")
+        print(self._header)
+        sys.stdout.write(_format_tasks(tasks))
+        sys.stdout.write("\n")
 
-# TaskManager class with polymorphism and error handling
+# TaskManager class with error handling
 class TaskManager:
     """
     Task Manager class that allows adding, viewing, updating, deleting, filtering, 
@@ -64,34 +98,122 @@ class TaskManager:
             db_name (str): The name of the SQLite database.
         """
         self.__db_name = db_name
+        self.__dates_cache = (None, None)  # (day the list was built for, list of date strings)
+        self.__conn = None
+        self.__fts_enabled = False
+        # cached_statements=128 is sqlite3's default, spelled out because the SQL_* constants rely on it
+        self.__conn = sqlite3.connect(self.__db_name, isolation_level=None, check_same_thread=False,
+                                      cached_statements=128)
         self.__init_db()
 
+    def __del__(self) -> None:
+        """
+        Close the database connection when the TaskManager is garbage collected.
+        """
+        self.close()
+
     def __init_db(self) -> None:
         """
-        Initialize the database by creating the tasks table if it doesn't exist.
+        Configure the connection and create the tasks table and its indexes if they don't exist.
         """
-        conn = sqlite3.connect(self.__db_name)
-        cursor = conn.cursor()
+        cursor = self.__conn.cursor()
+        # journal_mode is stored in the database file; the other settings are per-connection
+        cursor.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+        ''')
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 description TEXT NOT NULL,
                 deadline TEXT,
                 status TEXT CHECK(status IN ('Pending', 'Completed')) NOT NULL DEFAULT 'Pending',
-                priority TEXT CHECK(priority IN ('high', 'medium', 'low')) DEFAULT 'medium'
+                priority TEXT CHECK(priority IN ('high', 'medium', 'low')) DEFAULT 'medium',
+                priority_rank INTEGER GENERATED ALWAYS AS (
+                    CASE priority WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END
+                ) STORED
             )
         ''')
-        conn.commit()
-        conn.close()
+        # Databases created before priority_rank existed get it added in place;
+        # ALTER TABLE only supports VIRTUAL generated columns, which the index materializes anyway
+        columns = {row[1] for row in cursor.execute("PRAGMA table_xinfo(tasks)")}
+        if "priority_rank" not in columns:
+            cursor.execute('''
+                ALTER TABLE tasks ADD COLUMN priority_rank INTEGER GENERATED ALWAYS AS (
+                    CASE priority WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END
+                ) VIRTUAL
+            ''')
+        self.__fts_enabled = self.__init_fts(cursor)
+        cursor.executescript('''
+            DROP INDEX IF EXISTS idx_status_deadline;
+            -- Covers filter/due-soon reads; the rowid (id) is stored in every index entry
+            CREATE INDEX IF NOT EXISTS idx_cover ON tasks(status, deadline, description, priority);
+            CREATE INDEX IF NOT EXISTS idx_deadline ON tasks(deadline);
+            CREATE INDEX IF NOT EXISTS idx_priority_rank ON tasks(priority_rank);
+        ''')
+        # Gather planner statistics when tables or indexes were just created;
+        # otherwise PRAGMA optimize on close keeps them up to date
+        if cursor.execute("PRAGMA schema_version").fetchone()[0] != schema_version:
+            cursor.execute("ANALYZE")
+
+    def __init_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 index over task descriptions and the triggers that keep it in sync.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor on the task database.
 
-    def __connect(self) -> sqlite3.Connection:
+        Returns:
+            bool: True if full-text search is available, False if SQLite was built without FTS5.
         """
-        Connect to the SQLite database.
+        exists = cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone() is not None
+        try:
+            cursor.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(description, content='tasks', content_rowid='id');
+                CREATE TRIGGER IF NOT EXISTS tasks_ai AFTER INSERT ON tasks BEGIN
+                    INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS tasks_ad AFTER DELETE ON tasks BEGIN
+                    INSERT INTO tasks_fts(tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS tasks_au AFTER UPDATE OF description ON tasks BEGIN
+                    INSERT INTO tasks_fts(tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+                    INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description);
+                END;
+            ''')
+        except sqlite3.OperationalError:
+            return False  # Searches fall back to a substring scan
+        if not exists:
+            # Index tasks that were added before the FTS table existed
+            cursor.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+        return True
+
+    def __get_week_dates(self) -> list:
+        """
+        Get the next 7 dates starting today, rebuilding the cached list only when the day changes.
 
         Returns:
-            sqlite3.Connection: A connection to the database.
+            list: Dates formatted as "YYYY-MM-DD".
+        """
+        today = datetime.now().date()
+        cached_day, dates = self.__dates_cache
+        if cached_day != today:
+            dates = [(today + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+            self.__dates_cache = (today, dates)
+        return dates
+
+    def close(self) -> None:
+        """
+        Refresh planner statistics if needed and close the database connection.
+        Safe to call more than once.
         """
-        return sqlite3.connect(self.__db_name)
+        if self.__conn is not None:
+            self.__conn.execute("PRAGMA optimize")
+            self.__conn.close()
+            self.__conn = None
 
     def add_task(self, description: str, deadline: str, priority: str = "medium", status: str = "Pending") -> None:
         """
@@ -103,23 +225,43 @@ class TaskManager:
             priority (str): The priority of the task (default: "medium").
             status (str): The status of the task (default: "Pending").
         """
-        if not description:
-            print("Task description cannot be empty.")
-            return
-        if priority not in ["high", "medium", "low"]:
-            print("Invalid priority. Must be 'high', 'medium', or 'low'.")
-            return
-        if status not in ["Pending", "Completed"]:
-            print("Invalid status. Must be 'Pending' or 'Completed'.")
-            return
-        
-        conn = self.__connect()
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO tasks (description, deadline, status, priority) VALUES (?, ?, ?, ?)", 
-                       (description, deadline, status, priority))
-        conn.commit()
-        conn.close()
-        print("Task added successfully!")
+        if self.add_tasks([(description, deadline, status, priority)]):
+            print("Task added successfully!")
+
+    def add_tasks(self, rows: list) -> bool:
+        """
+        Add several tasks to the database in a single transaction.
+
+        Args:
+            rows (list): List of (description, deadline, status, priority) tuples.
+
+        Returns:
+            bool: True if all tasks were added, False if validation or the insert failed.
+        """
+        for description, deadline, status, priority in rows:
+            if not description:
+                print("Task description cannot be empty.")
+                return False
+            if priority not in _VALID_PRIORITY:
+                print("Invalid priority. Must be 'high', 'medium', or 'low'.")
+                return False
+            if status not in _VALID_STATUS:
+                print("Invalid status. Must be 'Pending' or 'Completed'.")
+                return False
+
+        cursor = self.__conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(SQL_INSERT, rows)
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK")
+            print(f"Failed to add tasks: {e}")
+            return False
+        except BaseException:
+            cursor.execute("ROLLBACK")  # Never leave the shared connection inside a transaction
+            raise
+        cursor.execute("COMMIT")
+        return True
 
     def view_tasks(self, order_by: str = None) -> list:
         """
@@ -131,16 +273,13 @@ class TaskManager:
         Returns:
             list: List of tasks from the database.
         """
-        conn = self.__connect()
-        cursor = conn.cursor()
-        query = "SELECT * FROM tasks"
         if order_by == "deadline":
-            query += " ORDER BY deadline"
+            query = SQL_SELECT_BY_DEADLINE
         elif order_by == "priority":
-            query += " ORDER BY CASE priority WHEN 'high' THEN 1 WHEN 'medium' THEN 2 WHEN 'low' THEN 3 END"
-        cursor.execute(query)
-        tasks = cursor.fetchall()
-        conn.close()
+            query = SQL_SELECT_BY_PRIORITY
+        else:
+            query = SQL_SELECT_ALL
+        tasks = self.__conn.execute(query).fetchall()
         if not tasks:
             print("No tasks available.")
         else:
@@ -153,8 +292,8 @@ class TaskManager:
         Args:
             task_ids (list): List of task IDs to update.
             description (str): New description for the task (optional).
-            status (str): New status for the task (optional).
-            priority (str): New priority for the task (optional).
+            status (str): New status, "1" for Pending or "2" for Completed (optional).
+            priority (str): New priority, "1" for high, "2" for low or "3" for medium (optional).
             deadline (str): New deadline for the task (optional).
         """
         try:
@@ -163,31 +302,38 @@ class TaskManager:
             print("Invalid task IDs. Task IDs must be numbers.")
             return
         
-        conn = self.__connect()
-        cursor = conn.cursor()
-        for task_id in task_ids:
-            cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-            task = cursor.fetchone()
+        placeholders = ",".join("?" * len(task_ids))
+        updates = []
+        if description:
+            updates.append(("description", description))
+        if status:
+            updates.append(("status", _STATUS_MAP.get(status, status)))
+        if priority:
+            updates.append(("priority", _PRIORITY_MAP.get(priority, priority)))
+        if deadline:
+            updates.append(("deadline", deadline))
+        if not updates:
+            print("No changes provided. Tasks were not updated.")
+            return
 
-            if not task:
+        assignments = ", ".join(f"{column} = ?" for column, _ in updates)
+        cursor = self.__conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")  # Apply all changes in a single transaction
+        try:
+            cursor.execute(f"UPDATE tasks SET {assignments} WHERE id IN ({placeholders}) RETURNING id",
+                           [value for _, value in updates] + task_ids)
+            updated_ids = {row[0] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK")
+            print(f"Failed to update tasks: {e}")
+            return
+        except BaseException:
+            cursor.execute("ROLLBACK")  # Never leave the shared connection inside a transaction
+            raise
+        cursor.execute("COMMIT")
+        for task_id in task_ids:
+            if task_id not in updated_ids:
                 print(f"No task found with ID {task_id}. Skipping this ID.")
-                continue
-            
-            if description:
-                cursor.execute("UPDATE tasks SET description = ? WHERE id = ?", (description, task_id))
-            
-            if status:
-                status = "Pending" if status == "1" else "Completed"
-                cursor.execute("UPDATE tasks SET status = ? WHERE id = ?", (status, task_id))
-            
-            if priority:
-                cursor.execute("UPDATE tasks SET priority = ? WHERE id = ?", (priority, task_id))
-            
-            if deadline:
-                cursor.execute("UPDATE tasks SET deadline = ? WHERE id = ?", (deadline, task_id))
-        
-        conn.commit()
-        conn.close()
         print(f"Tasks with IDs {task_ids} updated successfully!")
 
     def delete_task(self, task_ids: list) -> None:
@@ -203,20 +349,23 @@ class TaskManager:
             print("Invalid task IDs. Task IDs must be numbers.")
             return
         
-        conn = self.__connect()
-        cursor = conn.cursor()
+        placeholders = ",".join("?" * len(task_ids))
+        cursor = self.__conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")  # Apply all changes in a single transaction
+        try:
+            cursor.execute(f"DELETE FROM tasks WHERE id IN ({placeholders}) RETURNING id", task_ids)
+            deleted_ids = {row[0] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK")
+            print(f"Failed to delete tasks: {e}")
+            return
+        except BaseException:
+            cursor.execute("ROLLBACK")  # Never leave the shared connection inside a transaction
+            raise
+        cursor.execute("COMMIT")
         for task_id in task_ids:
-            cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-            task = cursor.fetchone()
-
-            if not task:
+            if task_id not in deleted_ids:
                 print(f"No task found with ID {task_id}. Skipping this ID.")
-                continue
-            
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        
-        conn.commit()
-        conn.close()
         print(f"Tasks with IDs {task_ids} deleted successfully!")
 
     def filter_tasks(self, status: str) -> None:
@@ -226,20 +375,17 @@ class TaskManager:
         Args:
             status (str): Status to filter by ("1" for Pending, "2" for Completed).
         """
-        if status not in ["1", "2"]:
+        if status not in _VALID_STATUS_CHOICE:
             print("Invalid status input. Please enter '1' for Pending or '2' for Completed.")
             return
-        status = "Pending" if status == "1" else "Completed"
-        conn = self.__connect()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE status = ?", (status,))
-        tasks = cursor.fetchall()
-        conn.close()
-        if not tasks:
+        status = _STATUS_MAP[status]
+        cursor = self.__conn.execute(SQL_FILTER, (status,))
+        first = cursor.fetchone()
+        if first is None:
             print(f"No {status} tasks available.")
         else:
-            for task in tasks:
-                print(f"ID: {task[0]}, Description: {task[1]}, Deadline: {task[2]}, Status: {task[3]}, Priority: {task[4]}")
+            sys.stdout.write(_format_tasks(chain((first,), cursor)))
+            sys.stdout.write("\n")
 
     def search_tasks(self, keyword: str) -> None:
         """
@@ -248,68 +394,70 @@ class TaskManager:
         Args:
             keyword (str): The keyword to search for in task descriptions.
         """
+        keyword = keyword.strip()
         if not keyword:
             print("Search keyword cannot be empty.")
             return
-        conn = self.__connect()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE description LIKE ?", (f"%{keyword}%",))
-        tasks = cursor.fetchall()
-        conn.close()
-        if not tasks:
+        if len(keyword) < 2:
+            print("Search keyword must be at least 2 characters.")
+            return
+        if self.__fts_enabled:
+            # Quote the keyword as a single FTS phrase and match it as a token prefix
+            phrase = keyword.replace('"', '""')
+            cursor = self.__conn.execute(SQL_SEARCH, (f'"{phrase}"*',))
+        else:
+            # Plain substring match; both sides go through SQLite's lower(), as with the LIKE it replaces
+            cursor = self.__conn.execute(SQL_SEARCH_INSTR, (keyword,))
+        first = cursor.fetchone()
+        if first is None:
             print("No matching tasks found.")
         else:
-            for task in tasks:
-                print(f"ID: {task[0]}, Description: {task[1]}, Deadline: {task[2]}, Status: {task[3]}, Priority: {task[4]}")
+            sys.stdout.write(_format_tasks(chain((first,), cursor)))
+            sys.stdout.write("\n")
 
     def due_soon_tasks(self) -> None:
         """
         View tasks that are due within the next 24 hours and are still pending.
         """
-        conn = self.__connect()
-        cursor = conn.cursor()
-        now = datetime.now()
-        upcoming = (now + timedelta(hours=24)).strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute("SELECT * FROM tasks WHERE deadline <= ? AND status = 'Pending'", (upcoming,))
-        tasks = cursor.fetchall()
-        conn.close()
-        print(f"Checking for tasks due on or before: {upcoming}")
+        cursor = self.__conn.execute(SQL_DUE_SOON)
+        first = cursor.fetchone()
+        print("Checking for pending tasks due on or before tomorrow.")
 
-        if not tasks:
+        if first is None:
             print("No tasks due soon.")
         else:
             print("Tasks due soon:")
-            for task in tasks:
-                print(f"ID: {task[0]}, Description: {task[1]}, Deadline: {task[2]}, Status: {task[3]}, Priority: {task[4]}")
+            sys.stdout.write(_format_tasks(chain((first,), cursor)))
+            sys.stdout.write("\n")
 
     def run(self) -> None:
         """
         Start the task manager program and provide the user with options to manage tasks.
         """
+        redraw = True  # Skip the menu redraw after an invalid choice
         while True:
-            print("\nTask Manager")
-            print("1. Add Task")
-            print("2. View Tasks")
-            print("3. Update Task")
-            print("4. Delete Task")
-            print("5. Filter Tasks")
-            print("6. Search Tasks")
-            print("7. View Due Soon Tasks")
-            print("8. Exit")
-            choice = input("Choose an option: ")
+            if redraw:
+                print("\nTask Manager")
+                print("1. Add Task")
+                print("2. View Tasks")
+                print("3. Update Task")
+                print("4. Delete Task")
+                print("5. Filter Tasks")
+                print("6. Search Tasks")
+                print("7. View Due Soon Tasks")
+                print("8. Exit")
+            redraw = True
+            choice = _prompt("Choose an option: ")
             
             if choice == "1":
-                description = input("Enter task description: ")
-                
-                # Generate a list of upcoming dates
-                today = datetime.now()
-                dates = [(today + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+                description = _prompt("Enter task description: ")
                 
+                dates = self.__get_week_dates()
                 print("Select a deadline:")
                 for idx, date in enumerate(dates, 1):
                     print(f"{idx}. {date}")
 
-                deadline_choice = input("Enter choice (1-7): ")
+                deadline_choice = _prompt("Enter choice (1-7): ")
                 if deadline_choice.isdigit() and 1 <= int(deadline_choice) <= 7:
                     deadline = dates[int(deadline_choice) - 1]
                 else:
@@ -320,14 +468,9 @@ class TaskManager:
                 print("1. High")
                 print("2. Low")
                 print("3. Medium")
-                priority_choice = input("Enter choice (1-3): ")
-                if priority_choice == "1":
-                    priority = "high"
-                elif priority_choice == "2":
-                    priority = "low"
-                elif priority_choice == "3":
-                    priority = "medium"
-                else:
+                priority_choice = _prompt("Enter choice (1-3): ")
+                priority = _PRIORITY_MAP.get(priority_choice)
+                if priority is None:
                     print("Invalid priority choice, setting to medium.")
                     priority = "medium"
                 
@@ -336,32 +479,30 @@ class TaskManager:
                 print("Sort tasks by:")
                 print("1. Deadline")
                 print("2. Priority")
-                order_by = input("Enter choice (1 for Deadline, 2 for Priority): ")
+                order_by = _prompt("Enter choice (1 for Deadline, 2 for Priority): ")
                 if order_by == "1":
                     tasks = self.view_tasks(order_by="deadline")
-                    view = DeadlineView()
+                    view = TaskView("Tasks sorted by Deadline:")
                 elif order_by == "2":
                     tasks = self.view_tasks(order_by="priority")
-                    view = PriorityView()
+                    view = TaskView("Tasks sorted by Priority:")
                 else:
                     print("Invalid choice. Showing tasks by deadline by default.")
                     tasks = self.view_tasks(order_by="deadline")
-                    view = DeadlineView()
+                    view = TaskView("Tasks sorted by Deadline:")
                 view.display(tasks)
             elif choice == "3":
-                task_ids = input("Enter task IDs to update: ").split(",")
-                description = input("Enter new description(leave blank to keep unchanged): ")
-                status = input("Enter new status (1 for Pending, 2 for Completed, leave blank to keep unchanged): ")
-                priority = input("Enter new priority (1 for High, 2 for Low, 3 for Medium, leave blank to keep unchanged): ")
-
-                # Generate a list of upcoming dates from today
-                today = datetime.now()
-                dates = [(today + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+                task_ids = _prompt("Enter task IDs to update: ").split(",")
+                description = _prompt("Enter new description(leave blank to keep unchanged): ")
+                status = _prompt("Enter new status (1 for Pending, 2 for Completed, leave blank to keep unchanged): ")
+                priority = _prompt("Enter new priority (1 for High, 2 for Low, 3 for Medium, leave blank to keep unchanged): ")
+
+                dates = self.__get_week_dates()
                 print("Select a new deadline:")
                 for idx, date in enumerate(dates, 1):
                     print(f"{idx}. {date}")
 
-                deadline_choice = input("Enter choice (1-7): ")
+                deadline_choice = _prompt("Enter choice (1-7): ")
                 if deadline_choice.isdigit() and 1 <= int(deadline_choice) <= 7:
                     deadline = dates[int(deadline_choice) - 1]
                 else:
@@ -370,21 +511,23 @@ class TaskManager:
 
                 self.update_task(task_ids, description, status, priority, deadline)
             elif choice == "4":
-                task_ids = input("Enter task IDs to delete: ").split(",")
+                task_ids = _prompt("Enter task IDs to delete: ").split(",")
                 self.delete_task(task_ids)
             elif choice == "5":
-                status = input("Enter task status to filter (1 for Pending, 2 for Completed): ")
+                status = _prompt("Enter task status to filter (1 for Pending, 2 for Completed): ")
                 self.filter_tasks(status)
             elif choice == "6":
-                keyword = input("Enter search keyword: ")
+                keyword = _prompt("Enter search keyword: ")
                 self.search_tasks(keyword)
             elif choice == "7":
                 self.due_soon_tasks()
             elif choice == "8":
                 print("Exiting Task Manager.")
+                self.close()
                 break
             else:
                 print("Invalid choice. Please try again.")
+                redraw = False
 
 
 